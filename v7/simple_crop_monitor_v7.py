@@ -9,8 +9,16 @@ import cv2
 import numpy as np
 import time
 import os
+import sys
+import queue
+import threading
 from datetime import datetime
 import json
+import functools
+
+# One image a minute: skip OpenCV's thread pool and OpenCL device probing
+cv2.setNumThreads(1)
+cv2.ocl.setUseOpenCL(False)
 
 try:
     import pyrealsense2 as rs
@@ -18,19 +26,201 @@ try:
 except ImportError:
     REALSENSE_AVAILABLE = False
 
+# GPU JPEG encoder (PyNvJpeg) - only present on Jetson/NVIDIA builds
+try:
+    from nvjpeg import NvJpeg
+    NVJPEG_AVAILABLE = True
+except ImportError:
+    NVJPEG_AVAILABLE = False
+
+# libjpeg-turbo SIMD encoder (PyTurboJPEG) - needs the libturbojpeg shared library
+try:
+    from turbojpeg import TurboJPEG, TJSAMP_420, TJFLAG_PROGRESSIVE
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
 # Configuration
 COMPONENT_ID = 198
 CAPTURE_INTERVAL = 60  # 1 minute
 IMAGE_OUTPUT = "/tmp/crop_latest.jpg"
 STATUS_FILE = "/tmp/crop_monitor_v7.json"
+# Status JSON with the constant fields serialized once
+STATUS_TEMPLATE = (b'{"timestamp": "%s", "capture_count": %d, "image_path": '
+                   + json.dumps(IMAGE_OUTPUT).encode() + b', "image_size": %d}')
+CAMERA_CACHE_FILE = "/tmp/crop_monitor_v7_camera.json"  # Last working (width, height, fps)
+# Color configs in order of preference (high-res first for crop images)
+COLOR_CONFIGS = [(1280, 720, 30), (848, 480, 30), (640, 480, 30), (640, 480, 15)]
+JPEG_QUALITY = 85
+# Optimized Huffman tables + progressive scan: smaller files for the relay at the same quality
+CV2_JPEG_PARAMS = [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY,
+                   cv2.IMWRITE_JPEG_OPTIMIZE, 1, cv2.IMWRITE_JPEG_PROGRESSIVE, 1]
+# Optional output size for the relayed JPEG; unset (0) keeps the native resolution
+TARGET_W = int(os.environ.get('ASTRA_CROP_WIDTH', '0'))
+TARGET_H = int(os.environ.get('ASTRA_CROP_HEIGHT', '0'))
+WRITE_QUEUE_SIZE = 2  # Frames waiting for the writer; oldest is dropped when full
+FRAME_BUFFERS = WRITE_QUEUE_SIZE + 1  # Queued frames plus the one being encoded
+WARMUP_SECONDS = 1.0  # Frames discarded after each stream start while exposure settles
+FRAME_TIMEOUT = 5.0  # Seconds without any frame before the watchdog forces a reconnect
 
 class SimpleCropMonitor:
     def __init__(self):
         self.pipeline = None
+        self.restart_stream = None  # start_stream bound to the running config, tried first on reconnect
         self.running = True
         self.capture_count = 0
         self.last_capture_time = 0
+        self.write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self.writer = None
+        self.encoder = self.select_encoder()
+        self.frame_shape = None
+        self.free_buffers = queue.Queue()  # Preallocated frame buffers not owned by the writer
+        self.last_capture_mono = None  # Interval clock for frame_callback
+        self.warmup_until = 0.0  # Monotonic end of the warmup window; 0 until the first frame
+        self.last_frame_mono = 0.0  # Monotonic arrival time of the newest frame, for the watchdog
+        self.first_frame = threading.Event()
+        self.reconnect_needed = threading.Event()  # Set from librealsense's thread, serviced by run()
+        self.time_sec = None  # Second the cached HH:MM:SS string belongs to
+        self.time_text = ''
+        # Under rover_manager stdout is a log file: write whole lines there and flush
+        # at most once a second instead of overwriting one terminal line
+        self.interactive = sys.stdout.isatty()
+        self.last_flush = 0.0
+
+    def time_str(self):
+        """HH:MM:SS for status lines, formatted at most once per second"""
+        sec = int(time.time())
+        if sec != self.time_sec:
+            self.time_sec = sec
+            self.time_text = time.strftime('%H:%M:%S', time.localtime(sec))
+        return self.time_text
+
+    def log(self, message):
+        """Timestamped status line, overwritten in place on a terminal"""
+        line = f"[{self.time_str()}] {message}"
+        if self.interactive:
+            print(f"\r{line}", end='', flush=True)
+            return
+        sys.stdout.write(line + '\n')
+        now = time.monotonic()
+        if now - self.last_flush >= 1.0:
+            sys.stdout.flush()
+            self.last_flush = now
+
+    def select_encoder(self):
+        """Pick the JPEG encoder once: NVJPEG, then libjpeg-turbo, then OpenCV"""
+        if NVJPEG_AVAILABLE:
+            try:
+                nvjpeg = NvJpeg()
+                print("JPEG encoder: NVJPEG (GPU)")
+                return lambda image: nvjpeg.encode(image, JPEG_QUALITY)
+            except Exception as e:
+                print(f"  [ENCODER] NVJPEG init failed: {e}")
+        if TURBOJPEG_AVAILABLE:
+            try:
+                tj = TurboJPEG()
+                print("JPEG encoder: libjpeg-turbo")
+                return lambda image: tj.encode(image, quality=JPEG_QUALITY, jpeg_subsample=TJSAMP_420,
+                                              flags=TJFLAG_PROGRESSIVE)
+            except Exception as e:
+                print(f"  [ENCODER] TurboJPEG init failed: {e}")
+        return self.encode_cv2
+
+    def encode_cv2(self, image):
+        """CPU JPEG encode via OpenCV; returns None on failure"""
+        ok, buf = cv2.imencode('.jpg', image, CV2_JPEG_PARAMS)
+        return buf if ok else None
         
+    def load_last_good_config(self):
+        """Return the (width, height, fps) that worked last run, if any"""
+        try:
+            with open(CAMERA_CACHE_FILE, 'r') as f:
+                cfg = json.load(f)
+            return (int(cfg['width']), int(cfg['height']), int(cfg['fps']))
+        except Exception:
+            return None
+
+    def save_last_good_config(self, width, height, fps):
+        """Remember the working config so the next start skips probing"""
+        try:
+            with open(CAMERA_CACHE_FILE, 'w') as f:
+                json.dump({'width': width, 'height': height, 'fps': fps}, f)
+        except Exception as e:
+            print(f"  [CONFIG] Failed to save camera config: {e}")
+
+    def supported_configs(self):
+        """(width, height, fps) set the device advertises for BGR color, or None if unknown"""
+        try:
+            devices = rs.context().query_devices()
+            if len(devices) == 0:
+                return set()
+            supported = set()
+            for profile in devices[0].first_color_sensor().get_stream_profiles():
+                if profile.stream_type() != rs.stream.color or profile.format() != rs.format.bgr8:
+                    continue
+                vp = profile.as_video_stream_profile()
+                supported.add((vp.width(), vp.height(), vp.fps()))
+            return supported
+        except Exception as e:
+            print(f"  [CONFIG] Profile query failed: {e}")
+            return None
+
+    def candidate_configs(self):
+        """Last known-good config first, then the preferred configs the device supports"""
+        cached = self.load_last_good_config()
+        if cached:
+            yield cached
+        # Only query the device if the cached config didn't work
+        supported = self.supported_configs()
+        for cfg in COLOR_CONFIGS:
+            if cfg != cached and (supported is None or cfg in supported):
+                yield cfg
+
+    def start_stream(self, width, height, fps, config=None):
+        """Start the color stream with one config and confirm frames arrive"""
+        # A pipeline that was stopped cleanly is reused; a failed start leaves None
+        if self.pipeline is None:
+            self.pipeline = rs.pipeline()
+        if config is None:
+            config = rs.config()
+            config.enable_stream(rs.stream.color, width, height, rs.format.bgr8, fps)
+        # Buffers must exist before the callback can deliver a frame
+        self.alloc_frame_buffers(width, height)
+        self.first_frame.clear()
+        self.last_capture_mono = None
+        # pipeline.start() can take seconds, so the warmup window opens on the first frame
+        self.warmup_until = 0.0
+
+        try:
+            # Frames are delivered on librealsense's thread to frame_callback
+            self.pipeline.start(config, self.frame_callback)
+
+            # One bounded wait decides the config: a good one delivers well within 3s,
+            # a bad one fails here instead of after ten separate timeouts
+            if not self.first_frame.wait(3.0):
+                raise RuntimeError("no color frame within 3s")
+            # Reconnects restart exactly this config without rebuilding it
+            self.restart_stream = functools.partial(self.start_stream, width, height, fps, config)
+            return True
+        except Exception as e:
+            print(f"  [CONFIG] {width}x{height} @ {fps}fps gave no frames: {e}")
+            try:
+                self.pipeline.stop()
+            except:
+                pass
+            self.pipeline = None
+            return False
+
+    def alloc_frame_buffers(self, width, height):
+        """Preallocate the frame buffers shared between capture and writer"""
+        shape = (height, width, 3)
+        if shape == self.frame_shape:
+            return
+        self.frame_shape = shape
+        self.free_buffers = queue.Queue()
+        for _ in range(FRAME_BUFFERS):
+            self.free_buffers.put(np.empty(shape, dtype=np.uint8))
+
     def connect_camera(self):
         """Connect to RealSense camera"""
         try:
@@ -39,64 +229,164 @@ class SimpleCropMonitor:
                 return False
                 
             print("Connecting to RealSense for image capture")
-            self.pipeline = rs.pipeline()
-            config = rs.config()
-            
-            # High-res color for crop images
-            config.enable_stream(rs.stream.color, 1280, 720, rs.format.bgr8, 30)
-            
-            self.pipeline.start(config)
-            
-            # Warm-up
-            for _ in range(10):
-                self.pipeline.wait_for_frames(timeout_ms=1000)
-                
-            print("✓ RealSense connected")
-            return True
+
+            for cfg in self.candidate_configs():
+                if self.start_stream(*cfg):
+                    self.save_last_good_config(*cfg)
+                    print(f"✓ RealSense connected - {cfg[0]}x{cfg[1]} @ {cfg[2]}fps")
+                    return True
+
+            print("✗ RealSense connection failed: no working color config")
+            return False
             
         except Exception as e:
             print(f"✗ RealSense connection failed: {e}")
             return False
             
-    def capture_image(self):
-        """Capture and save single image"""
-        if not self.pipeline:
-            return False
-            
+    def frame_callback(self, frame):
+        """RealSense frame callback - keeps one frame per CAPTURE_INTERVAL, drops the rest"""
         try:
-            # Capture frame
-            frames = self.pipeline.wait_for_frames(timeout_ms=1000)
-            color_frame = frames.get_color_frame()
-            
+            if frame.is_frameset():
+                color_frame = frame.as_frameset().get_color_frame()
+            else:
+                color_frame = frame.as_video_frame()
             if not color_frame:
-                return False
-                
-            # Convert to numpy array
-            image = np.asanyarray(color_frame.get_data())
-            
-            # Save image
-            cv2.imwrite(IMAGE_OUTPUT, image, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                return
+            self.first_frame.set()
+
+            now = time.monotonic()
+            self.last_frame_mono = now
+            if not self.warmup_until:
+                self.warmup_until = now + WARMUP_SECONDS
+            if now < self.warmup_until:
+                return
+            # The first capture lands on the first frame after warmup and anchors the interval
+            if self.last_capture_mono is not None and now - self.last_capture_mono < CAPTURE_INTERVAL:
+                return
+            self.last_capture_mono = now
+            self.capture_image(color_frame)
+
+        except rs.error as e:
+            self.handle_camera_error(e)
+        except Exception as e:
+            self.log(f"✗ Frame callback failed: {e}")
+
+    def handle_camera_error(self, e):
+        """Request a reconnect only for error types that mean the device went away"""
+        self.log(f"✗ RealSense error in {e.get_failed_function()}: {e}")
+        if e.get_type() in (rs.exception_type.camera_disconnected,
+                            rs.exception_type.io,
+                            rs.exception_type.backend):
+            self.reconnect_needed.set()
+
+    def reconnect_camera(self):
+        """Tear the pipeline down and bring it back up (never from the frame callback)"""
+        print(f"\n[{self.time_str()}] Camera lost - reconnecting...")
+        if self.pipeline:
+            try:
+                self.pipeline.stop()
+            except:
+                # Don't restart a pipeline that wouldn't stop cleanly
+                self.pipeline = None
+
+        # The config that was just streaming gets two quick tries before the full ladder
+        failures = 0
+        while self.running:
+            if self.restart_stream and failures < 2:
+                if self.restart_stream():
+                    w, h, fps = self.restart_stream.args[:3]
+                    print(f"✓ RealSense reconnected - {w}x{h} @ {fps}fps")
+                    return
+            elif self.connect_camera():
+                return
+            failures += 1
+            time.sleep(1 if failures < 2 else 5)
+
+    def capture_image(self, color_frame):
+        """Copy one color frame and hand it to the writer thread"""
+        try:
+            # View the RealSense buffer in place, then make the one copy into a buffer
+            # we own - the frame is recycled once we return
+            frame = np.frombuffer(color_frame.get_data(), dtype=np.uint8).reshape(self.frame_shape)
+            try:
+                image = self.free_buffers.get_nowait()
+            except queue.Empty:
+                # Writer is behind - reuse the oldest queued frame's buffer
+                try:
+                    image = self.write_queue.get_nowait()[0]
+                except queue.Empty:
+                    image = self.free_buffers.get(timeout=1)
+            np.copyto(image, frame)
             
-            # Update status
             self.capture_count += 1
             self.last_capture_time = time.time()
-            
-            status = {
-                'timestamp': datetime.now().isoformat(),
-                'capture_count': self.capture_count,
-                'image_path': IMAGE_OUTPUT,
-                'image_size': os.path.getsize(IMAGE_OUTPUT) if os.path.exists(IMAGE_OUTPUT) else 0
-            }
-            
-            with open(STATUS_FILE, 'w') as f:
-                json.dump(status, f)
-            
-            print(f"\r[{datetime.now().strftime('%H:%M:%S')}] ✓ Captured image #{self.capture_count}", end='')
+            item = (image, self.last_capture_time, self.capture_count)
+            try:
+                self.write_queue.put_nowait(item)
+            except queue.Full:
+                # Drop the oldest frame rather than stall the camera
+                try:
+                    self.free_buffers.put(self.write_queue.get_nowait()[0])
+                except queue.Empty:
+                    pass
+                self.write_queue.put_nowait(item)
             return True
-            
+
+        except rs.error as e:
+            self.handle_camera_error(e)
+            return False
         except Exception as e:
-            print(f"\r[{datetime.now().strftime('%H:%M:%S')}] ✗ Capture failed: {e}", end='')
+            self.log(f"✗ Capture failed: {e}")
             return False
+
+    def write_file(self, path, buf):
+        """Write an encoded buffer with one open/close, looping on short writes"""
+        view = memoryview(buf).cast('B')
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+    def writer_thread(self):
+        """Encode and save queued frames so JPEG/disk work stays off the capture path"""
+        while self.running or not self.write_queue.empty():
+            try:
+                image, captured_at, count = self.write_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+
+            try:
+                out = image
+                if TARGET_W and TARGET_H and image.shape[:2] != (TARGET_H, TARGET_W):
+                    # INTER_AREA averages source pixels, so downscaled crops don't alias
+                    out = cv2.resize(image, (TARGET_W, TARGET_H), interpolation=cv2.INTER_AREA)
+                buf = self.encoder(out)
+                if buf is None:
+                    raise RuntimeError("JPEG encode failed")
+
+                # Write beside the output and rename so the relay never reads a partial JPEG
+                tmp_path = IMAGE_OUTPUT + '.tmp'
+                self.write_file(tmp_path, buf)
+                os.replace(tmp_path, IMAGE_OUTPUT)
+
+                # Update status - only the per-capture fields are formatted, then the
+                # file is swapped in so readers never see a partial write
+                status = STATUS_TEMPLATE % (
+                    datetime.fromtimestamp(captured_at).isoformat().encode(), count, len(buf))
+                self.write_file(STATUS_FILE + '.tmp', status)
+                os.replace(STATUS_FILE + '.tmp', STATUS_FILE)
+                
+                self.log(f"✓ Captured image #{count}")
+                
+            except Exception as e:
+                self.log(f"✗ Save failed: {e}")
+
+            finally:
+                # Buffers from before a resolution change are simply let go
+                if image.shape == self.frame_shape:
+                    self.free_buffers.put(image)
             
     def run(self):
         """Main execution loop"""
@@ -115,19 +405,22 @@ class SimpleCropMonitor:
         print("  • Capturing 1 image per minute")
         print("  • Images saved to /tmp for relay")
         print()
-        
-        # Initial capture
-        self.capture_image()
+
+        self.writer = threading.Thread(target=self.writer_thread, daemon=True)
+        self.writer.start()
         
         try:
+            # Captures are driven by frame_callback (the first one fires once the
+            # warmup frames are discarded); this thread only handles reconnects
             while self.running:
-                current_time = time.time()
-                
-                # Check if it's time for next capture
-                if current_time - self.last_capture_time >= CAPTURE_INTERVAL:
-                    self.capture_image()
-                    
-                time.sleep(1)
+                # A camera that silently stops delivering raises nothing, so also
+                # reconnect when the callback has gone quiet
+                if not self.reconnect_needed.wait(1.0):
+                    if time.monotonic() - self.last_frame_mono < FRAME_TIMEOUT:
+                        continue
+                    print(f"\n[{self.time_str()}] ✗ No frames for {FRAME_TIMEOUT:.0f}s")
+                self.reconnect_needed.clear()
+                self.reconnect_camera()
                 
         except KeyboardInterrupt:
             print("\n\nShutdown initiated...")
@@ -140,6 +433,10 @@ class SimpleCropMonitor:
                     self.pipeline.stop()
                 except:
                     pass
+
+            # Let the writer flush whatever is still queued
+            if self.writer:
+                self.writer.join(timeout=5)
                     
             print("\n✓ Crop monitor stopped")
             print(f"Total captures: {self.capture_count}")
@@ -488,11 +488,13 @@ class ComboProximityBridge:
                         out_path = '/tmp/realsense_latest.jpg'
                         ok = cv2.imwrite(tmp_path, color_image, [cv2.IMWRITE_JPEG_QUALITY, 85])
                         if ok:
+                            # Only ever rename over out_path: the crop monitor mmaps it, and an
+                            # in-place rewrite would truncate the mapped inode (SIGBUS). If the
+                            # rename fails, skip this frame and try again with the next one.
                             try:
                                 os.replace(tmp_path, out_path)
-                            except Exception:
-                                # If atomic replace fails, fall back to simple write
-                                cv2.imwrite(out_path, color_image, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                            except OSError:
+                                pass
                     except Exception:
                         pass  # Silent fail - streaming is optional
 
@@ -37,11 +37,19 @@ def install_dependencies():
         'pymavlink': 'pymavlink',
         'pyrealsense2': 'pyrealsense2',
         'opencv-python': 'cv2',
+        'simplejpeg': 'simplejpeg',
+        'inotify_simple': 'inotify_simple',
         'numpy': 'numpy',
         'Pillow': 'PIL',
         'requests': 'requests',
         'flask': 'flask',
-        'flask-cors': 'flask_cors'
+        'flask-cors': 'flask_cors',
+        'flask-sock': 'flask_sock',
+        'orjson': 'orjson',
+        'rcssmin': 'rcssmin',
+        'rjsmin': 'rjsmin',
+        'brotli': 'brotli',
+        'gevent': 'gevent'
     }
 
     venv_path = os.path.expanduser("~/rover_venv")
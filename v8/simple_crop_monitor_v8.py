@@ -8,13 +8,31 @@ Component 198 - Image archive with rolling dashboard buffer
 try:
     import cv2
     import numpy as np
+    # One image every few seconds: skip OpenCV's thread pool and OpenCL device probing
+    cv2.setNumThreads(1)
+    cv2.ocl.setUseOpenCL(False)
     CV2_AVAILABLE = True
 except Exception as e:
     CV2_AVAILABLE = False
     print(f"[ERROR] OpenCV not available: {e}")
+# libjpeg-turbo binding without the cv2.Mat wrapper - faster encode when installed
+try:
+    import simplejpeg
+    SIMPLEJPEG_AVAILABLE = True
+except ImportError:
+    SIMPLEJPEG_AVAILABLE = False
+# Linux inotify - wakes as soon as the bridge publishes its first frame instead of polling
+try:
+    from inotify_simple import INotify, flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+import errno
 import time
 import os
-import glob
+import sys
+import mmap
+from collections import deque
 from datetime import datetime
 import json
 
@@ -26,6 +44,21 @@ IMAGE_DIR = "/tmp/crop_archive"  # Directory for archived images
 DASHBOARD_DIR = "/tmp/rover_vision"  # Directory for dashboard rolling images (1-10)
 STATUS_FILE = "/tmp/crop_monitor_v8.json"
 SOURCE_IMAGE = "/tmp/realsense_latest.jpg"  # Image from proximity bridge
+VERBOSE = os.environ.get('ASTRA_CROP_VERBOSE', '0') == '1'  # Extra per-slot/startup chatter
+SENDFILE_AVAILABLE = sys.platform.startswith('linux') and hasattr(os, 'sendfile')  # file-to-file copy
+SENDFILE_UNSUPPORTED = (errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP)  # e.g. some FUSE/overlay mounts
+JPEG_QUALITY = 85  # Only used when a source frame has to be re-encoded
+MIN_JPEG_SIZE = 512  # Smaller than any real camera frame; shorter reads are treated as damaged
+STATUS_EVERY = 4  # Rewrite the status file every Nth capture (first capture always)
+
+# Status JSON with the constant fields serialized once; only per-capture values are formatted in
+STATUS_TEMPLATE = (
+    b'{"timestamp": "%s", "capture_count": %d, '
+    b'"latest_image": ' + json.dumps(os.path.join(IMAGE_DIR, 'crop_%s.jpg')).encode() + b', '
+    b'"image_size": %d, "total_archived": %d, '
+    b'"archive_dir": ' + json.dumps(IMAGE_DIR).encode() + b', '
+    b'"latest_image_timestamp": %.6f, "current_slot": %d}'
+)
 
 # Create directories if they don't exist
 os.makedirs(IMAGE_DIR, exist_ok=True)
@@ -35,120 +68,263 @@ class SimpleCropMonitor:
     def __init__(self):
         self.running = True
         self.capture_count = 0
-        self.last_capture_time = 0
+        self.last_capture_time = 0  # time.monotonic() of the last successful capture
         self.current_slot = 1  # Rolling slot number 1-10
+        # Slot paths never change; (path, temp path) for slots 1-10 built once
+        self.slot_paths = [(path, path + '.tmp') for path in
+                           (os.path.join(DASHBOARD_DIR, f"{i}.jpg") for i in range(1, 11))]
+        self.archive_prefix = os.path.join(IMAGE_DIR, "crop_")  # Joined once, not per capture
+        self.archive = self.scan_archive()
+        # Under rover_manager stdout is a log file, so '\r' overwrites only make sense on a terminal
+        self.interactive = sys.stdout.isatty()
+
+    def log_event(self, message, verbose=False):
+        """Print a timestamped status line (verbose lines only if enabled)"""
+        if verbose and not VERBOSE:
+            return
+        lt = time.localtime()
+        line = f"[{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}] {message}"
+        if self.interactive:
+            print(f"\r{line}", end='', flush=True)
+        else:
+            print(line)
+
+    def wait_for_source(self, timeout=None):
+        """Block until SOURCE_IMAGE exists; False if it didn't appear within timeout seconds"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if INOTIFY_AVAILABLE:
+            try:
+                with INotify() as inotify:
+                    # The bridge writes a temp file and renames it over SOURCE_IMAGE
+                    inotify.add_watch(os.path.dirname(SOURCE_IMAGE), flags.CLOSE_WRITE | flags.MOVED_TO)
+                    name = os.path.basename(SOURCE_IMAGE)
+                    # Checked after the watch is added so a file created in between isn't missed
+                    while not os.path.exists(SOURCE_IMAGE):
+                        wait_ms = None
+                        if deadline is not None:
+                            wait_ms = int((deadline - time.monotonic()) * 1000)
+                            if wait_ms <= 0:
+                                return False
+                        for event in inotify.read(timeout=wait_ms):
+                            if event.name == name:
+                                return True
+                    return True
+            except OSError as e:
+                print(f"  [SOURCE] inotify unavailable, polling instead: {e}")
+
+        while not os.path.exists(SOURCE_IMAGE):
+            if deadline is None:
+                time.sleep(1)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(1.0, remaining))
+        return True
 
     def check_source_available(self):
         """Wait for proximity bridge to start providing images"""
         print("Waiting for Proximity Bridge to start providing images...")
         
-        for i in range(20):
-            if os.path.exists(SOURCE_IMAGE):
+        for waited in range(5, 25, 5):
+            if self.wait_for_source(5):
                 print(f"✓ Found image source from Proximity Bridge")
                 return True
-            time.sleep(1)
-            if i % 5 == 0:
-                print(f"  Still waiting... ({i}/20 seconds)")
+            print(f"  Still waiting... ({waited}/20 seconds)")
         
         print(f"✗ Proximity Bridge not providing images after 20 seconds")
         print(f"   Make sure Proximity Bridge (Component 195) is running first!")
         return False
 
+    def scan_archive(self):
+        """Archived image paths, oldest first (scanned once at startup)"""
+        try:
+            # DirEntry caches the stat so sorting doesn't re-stat every file
+            with os.scandir(IMAGE_DIR) as it:
+                images = [e for e in it if e.name.startswith('crop_') and e.name.endswith('.jpg')]
+            images.sort(key=lambda e: e.stat().st_mtime)
+            return deque(e.path for e in images)
+        except Exception as e:
+            print(f"\n  [ARCHIVE] Archive scan failed: {e}")
+            return deque()
+
     def manage_image_archive(self):
         """Manage rolling archive - delete oldest if over limit"""
+        # This process is the only writer, so the in-memory list stays in step with the directory
+        while len(self.archive) >= MAX_IMAGES:
+            oldest = self.archive.popleft()
+            try:
+                os.remove(oldest)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"\n  [ARCHIVE] Failed to delete {oldest}: {e}")
+                self.archive.appendleft(oldest)
+                break
+
+    def encode_jpeg(self, image, quality):
+        """Encode a BGR image to JPEG bytes (None on failure)"""
+        if SIMPLEJPEG_AVAILABLE:
+            return simplejpeg.encode_jpeg(image, quality=quality, colorspace='BGR')
+        # Optimized Huffman tables + progressive scan shrink the archived file at the same quality
+        ok, buf = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, quality,
+                                               cv2.IMWRITE_JPEG_OPTIMIZE, 1,
+                                               cv2.IMWRITE_JPEG_PROGRESSIVE, 1])
+        return buf if ok else None
+
+    def reencode_jpeg(self, data):
+        """Decode a source file that failed the JPEG marker check and re-encode it"""
+        if not CV2_AVAILABLE:
+            self.log_event("✗ OpenCV not installed")
+            return None
+        # data is already mapped; a corrupt frame makes imdecode return None rather than raise
+        image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR) if len(data) else None
+        if image is None or image.size == 0:
+            self.log_event("✗ Invalid image data")
+            return None
+        buf = self.encode_jpeg(image, JPEG_QUALITY)
+        if buf is None:
+            self.log_event("✗ JPEG encode failed")
+        return buf
+
+    def write_file(self, path, buf, src_fd=None):
+        """Write an encoded JPEG as a new file renamed into place, returning its size"""
+        # Never truncate in place: dashboard slots may be hard links to the old file
+        tmp_path = path + '.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
         try:
-            images = sorted(glob.glob(os.path.join(IMAGE_DIR, "crop_*.jpg")), 
-                          key=os.path.getmtime)
-            
-            while len(images) >= MAX_IMAGES:
-                oldest = images.pop(0)
+            offset = 0
+            if src_fd is not None and SENDFILE_AVAILABLE:
+                # buf is src_fd's contents; let the kernel copy it file to file
                 try:
-                    os.remove(oldest)
-                except Exception as e:
-                    print(f"\n  [ARCHIVE] Failed to delete {oldest}: {e}")
-                    break
+                    while offset < len(buf):
+                        sent = os.sendfile(fd, src_fd, offset, len(buf) - offset)
+                        if sent == 0:
+                            # Source shrank under us; never publish a truncated JPEG
+                            raise OSError(f"short copy to {path}: {offset}/{len(buf)} bytes")
+                        offset += sent
+                except OSError as e:
+                    # The filesystem can't sendfile; buf is already in memory, so write it below
+                    if offset or e.errno not in SENDFILE_UNSUPPORTED:
+                        raise
+            # Loop on short writes, as v7's write_file does; the views are released
+            # on exit so an mmap'd buf can still be closed by the caller
+            with memoryview(buf) as whole, whole.cast('B') as view:
+                while offset < len(view):
+                    offset += os.write(fd, view[offset:])
+            # Size comes from the open fd, so the status file needs no extra stat()
+            size = os.fstat(fd).st_size
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+        os.close(fd)
+        os.replace(tmp_path, path)
+        return size
+
+    def publish_slot(self, archive_path, slot, buf):
+        """Point a dashboard slot at the archived file; copy only if linking fails"""
+        dashboard_path, tmp_path = self.slot_paths[slot - 1]
+        try:
+            # Hard link + rename: no second write, and the slot is swapped atomically
+            try:
+                os.link(archive_path, tmp_path)
+            except FileExistsError:
+                # Left behind by an interrupted run
+                os.remove(tmp_path)
+                os.link(archive_path, tmp_path)
+            os.replace(tmp_path, dashboard_path)
+            return True
+        except OSError:
+            # e.g. EXDEV if the two directories end up on different filesystems
+            return self.write_file(dashboard_path, buf) > 0
+
+    def write_status(self, status):
+        """Write the status bytes via rename so the dashboard never reads it half-written"""
+        try:
+            self.write_file(STATUS_FILE, status)
         except Exception as e:
-            print(f"\n  [ARCHIVE] Archive management failed: {e}")
+            print(f"\n  [STATUS] Failed to write status file: {e}")
 
-    def capture_image(self):
-        """Copy image from proximity bridge to archive and dashboard slots"""
+    def capture_image(self, slots=1):
+        """Copy image from proximity bridge to the archive and the next `slots` dashboard slots"""
         if not os.path.exists(SOURCE_IMAGE):
-            print(f"\r[{datetime.now().strftime('%H:%M:%S')}] ✗ Source image not available", end='')
-            return False
-        if not CV2_AVAILABLE:
-            print(f"\r[{datetime.now().strftime('%H:%M:%S')}] ✗ OpenCV not installed", end='')
+            self.log_event("✗ Source image not available")
             return False
 
+        data = b''
+        src_fd = None
         try:
-            # Read image from proximity bridge robustly to avoid partial reads
-            # when the producer replaces the file while we're reading it.
-            try:
-                with open(SOURCE_IMAGE, 'rb') as f:
-                    data = f.read()
-                npbuf = np.frombuffer(data, dtype=np.uint8)
-                image = cv2.imdecode(npbuf, cv2.IMREAD_COLOR)
-            except Exception:
-                image = cv2.imread(SOURCE_IMAGE)
-            if image is None or image.size == 0:
-                print(f"\r[{datetime.now().strftime('%H:%M:%S')}] ✗ Invalid image data", end='')
-                return False
+            # Map instead of read(): the marker check touches two pages and the copy below
+            # never pulls the frame into Python. This relies on the bridge only ever
+            # renaming new frames over the path (it skips a frame rather than rewrite in
+            # place); truncating the mapped inode would SIGBUS on the next access.
+            src_fd = os.open(SOURCE_IMAGE, os.O_RDONLY)
+            if os.fstat(src_fd).st_size:
+                data = mmap.mmap(src_fd, 0, access=mmap.ACCESS_READ)
+
+            if len(data) >= MIN_JPEG_SIZE and data[:2] == b'\xff\xd8' and data[-2:] == b'\xff\xd9':
+                # Complete JPEG from the bridge - store its bytes as-is, no decode/encode
+                buf, copy_fd = data, src_fd
+            else:
+                buf, copy_fd = self.reencode_jpeg(data), None
+                if buf is None:
+                    return False
 
             # 1. Save to archive with timestamp
             self.manage_image_archive()
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            archive_path = os.path.join(IMAGE_DIR, f"crop_{timestamp}.jpg")
-            ok_archive = cv2.imwrite(archive_path, image, [cv2.IMWRITE_JPEG_QUALITY, 70])
+            # One clock read per capture serves the archive name and the status timestamp
+            now = datetime.now()
+            timestamp = (f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+                         f"{now.hour:02d}{now.minute:02d}{now.second:02d}")
+            archive_path = f"{self.archive_prefix}{timestamp}.jpg"
+            archive_size = self.write_file(archive_path, buf, copy_fd)
+            # Two captures in the same second share a name; the second replaces the first
+            if not self.archive or self.archive[-1] != archive_path:
+                self.archive.append(archive_path)
 
             # 2. Save to dashboard rolling buffer (1-10)
-            dashboard_path = os.path.join(DASHBOARD_DIR, f"{self.current_slot}.jpg")
-            ok_dash = cv2.imwrite(dashboard_path, image, [cv2.IMWRITE_JPEG_QUALITY, 85])
+            next_slot = self.current_slot
+            slot_ok = bool(archive_size)
+            for i in range(slots):
+                slot = (next_slot + i - 1) % 10 + 1
+                slot_ok = slot_ok and self.publish_slot(archive_path, slot, buf)
+                if slots > 1:
+                    self.log_event(f"• Initialized slot {slot}/10 {'✓' if slot_ok else '✗'}", verbose=True)
 
-            if not ok_archive or not ok_dash:
-                print(f"\r[{datetime.now().strftime('%H:%M:%S')}] ✗ Failed to save image(s)", end='')
+            if not archive_size or not slot_ok:
+                self.log_event("✗ Failed to save image(s)")
                 return False
             
             # Update status
             self.capture_count += 1
-            self.last_capture_time = time.time()
-            num_archived = len(glob.glob(os.path.join(IMAGE_DIR, "crop_*.jpg")))
+            self.last_capture_time = time.monotonic()
+            num_archived = len(self.archive)
             
             # Advance to next slot (1-10 rolling)
-            next_slot = self.current_slot
-            self.current_slot = (self.current_slot % 10) + 1
+            self.current_slot = (next_slot + slots - 1) % 10 + 1
             
             # Debug output
-            print(f"\r[{datetime.now().strftime('%H:%M:%S')}] ✓ Image #{self.capture_count} → slot {next_slot} (archive: {num_archived}/{MAX_IMAGES})", end='')
+            self.log_event(f"✓ Image #{self.capture_count} → slot {next_slot} (archive: {num_archived}/{MAX_IMAGES})")
 
             # Write status file
-            # Compute sizes safely
-            try:
-                archive_size = os.path.getsize(archive_path)
-            except Exception:
-                archive_size = 0
-
-            status = {
-                'timestamp': datetime.now().isoformat(),
-                'capture_count': self.capture_count,
-                'latest_image': archive_path,
-                'image_size': archive_size,
-                'total_archived': num_archived,
-                'archive_dir': IMAGE_DIR,
-                'latest_image_timestamp': time.time(),
-                'current_slot': self.current_slot
-            }
-
-            try:
-                with open(STATUS_FILE, 'w') as f:
-                    json.dump(status, f)
-            except Exception as e:
-                print(f"\n  [STATUS] Failed to write status file: {e}")
+            if self.capture_count == 1 or self.capture_count % STATUS_EVERY == 0:
+                self.write_status(STATUS_TEMPLATE % (
+                    now.isoformat().encode(), self.capture_count, timestamp.encode(),
+                    archive_size, num_archived, time.time(), self.current_slot))
 
             return True
 
         except Exception as e:
-            print(f"\r[{datetime.now().strftime('%H:%M:%S')}] ✗ Capture failed: {e}", end='')
+            self.log_event(f"✗ Capture failed: {e}")
             return False
 
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+            if src_fd is not None:
+                os.close(src_fd)
+
     def run(self):
         """Main execution loop"""
         print("=" * 60)
@@ -164,8 +340,7 @@ class SimpleCropMonitor:
         if not self.check_source_available():
             print("✗ Image source not available yet - will keep waiting and retrying...")
             # Keep waiting until source appears instead of exiting
-            while not os.path.exists(SOURCE_IMAGE):
-                time.sleep(1)
+            self.wait_for_source()
             print("✓ Source image detected, continuing...")
 
         print("\n✓ Crop monitor operational")
@@ -177,14 +352,11 @@ class SimpleCropMonitor:
 
         # Initialize all 10 dashboard slots
         print("Initializing dashboard slots (1-10)...")
-        for i in range(10):
-            success = self.capture_image()
-            if success:
-                print(f"  • Initialized slot {i+1}/10 ✓")
-            else:
-                print(f"  • Failed to initialize slot {i+1}/10 ✗")
-            time.sleep(0.3)
-        print("✓ All dashboard slots initialized\n")
+        # One frame fills every slot: a single read and archive file, linked ten times
+        if self.capture_image(slots=10):
+            print("✓ All dashboard slots initialized\n")
+        else:
+            print("✗ Failed to initialize dashboard slots - they will fill as captures run\n")
         
         # Reset to slot 1 for normal operation
         self.current_slot = 1
@@ -193,24 +365,24 @@ class SimpleCropMonitor:
             consecutive_failures = 0
             max_failures = 5
             
+            # Captures run on a fixed monotonic grid; the loop sleeps straight to the next slot
+            next_deadline = self.last_capture_time + CAPTURE_INTERVAL
             while self.running:
-                current_time = time.time()
+                time.sleep(max(0.0, next_deadline - time.monotonic()))
 
-                # Check if it's time for next capture
-                if current_time - self.last_capture_time >= CAPTURE_INTERVAL:
-                    success = self.capture_image()
-                    
-                    if success:
+                success = self.capture_image()
+                if success:
+                    consecutive_failures = 0
+                else:
+                    consecutive_failures += 1
+                    if consecutive_failures >= max_failures:
+                        print(f"\n⚠ Too many consecutive failures ({max_failures})")
+                        print(f"  Proximity bridge may have stopped")
+                        # Keep trying but don't exit
                         consecutive_failures = 0
-                    else:
-                        consecutive_failures += 1
-                        if consecutive_failures >= max_failures:
-                            print(f"\n⚠ Too many consecutive failures ({max_failures})")
-                            print(f"  Proximity bridge may have stopped")
-                            # Keep trying but don't exit
-                            consecutive_failures = 0
 
-                time.sleep(1)
+                # After a stall, restart the grid rather than firing the missed captures back to back
+                next_deadline = max(next_deadline + CAPTURE_INTERVAL, time.monotonic())
 
         except KeyboardInterrupt:
             print("\n\n✓ Crop monitor stopped by user")
@@ -4,13 +4,33 @@ Project Astra NZ - Web Telemetry Dashboard V8
 Real-time monitoring interface for proximity sensors and system status - Bug Fixes from V7
 """
 
+# Run as a script, serve with gevent so SSE clients share one thread instead of one each.
+# Patching has to happen before threading is imported or the Condition below would block the hub.
+GEVENT_AVAILABLE = False
+if __name__ == '__main__':
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+        from gevent.pywsgi import WSGIServer
+        GEVENT_AVAILABLE = True
+    except ImportError:
+        pass
+
+import glob
+import gzip
+import hashlib
+import io
 import json
 import time
 import threading
 import os
+import re
 import socket
+import struct
 from datetime import datetime
-from flask import Flask, render_template_string, jsonify, request, redirect, session, url_for
+from functools import lru_cache
+from flask import Flask, Response, abort, render_template_string, jsonify, request, redirect, send_file, session, url_for
+from flask.json.provider import DefaultJSONProvider
 # Make numpy optional; dashboard should not crash if it's missing
 try:
     import numpy as np
@@ -25,6 +45,55 @@ except ImportError:
     CORS_AVAILABLE = False
     print("[WARNING] flask-cors not installed - CORS disabled")
 
+# flask-sock adds a WebSocket route that sends radar distances as binary frames
+try:
+    from flask_sock import Sock
+    SOCK_AVAILABLE = True
+except ImportError:
+    SOCK_AVAILABLE = False
+
+# Optional minifiers for the dashboard's inline CSS and JS; without them the page is only gzipped
+try:
+    from rcssmin import cssmin
+    from rjsmin import jsmin
+    MINIFY_AVAILABLE = True
+except ImportError:
+    MINIFY_AVAILABLE = False
+
+# Brotli beats gzip on the dashboard page; browsers only offer it over HTTPS
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# orjson is much faster for the telemetry hot paths; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Linux inotify - reload telemetry when a status file is rewritten instead of polling
+try:
+    from inotify_simple import INotify, flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+# With numpy and orjson, proximity lives in a fixed uint16 array that orjson serializes directly
+PROXIMITY_ARRAY = np is not None and ORJSON_AVAILABLE
+
+def json_dumps_bytes(obj) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode()
+
+def json_loads(data):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Try to import sensor libraries (optional for dashboard)
 try:
     from rplidar import RPLidar
@@ -38,9 +107,33 @@ try:
 except ImportError:
     REALSENSE_AVAILABLE = False
 
+# Only needed to draw the placeholder for an empty crop slot
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Route jsonify and request.get_json through orjson"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Build the body as bytes directly instead of str -> encode
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 if CORS_AVAILABLE:
     CORS(app)
+sock = Sock(app) if SOCK_AVAILABLE else None
 app.secret_key = os.environ.get('ASTRA_DASHBOARD_SECRET', 'astra-dashboard-secret')
 SIGNUP_SECRET = os.environ.get('ASTRA_SIGNUP_CODE', 'LETMEIN')
 USERS_FILE = '/tmp/astra_dashboard_users.json'
@@ -64,7 +157,7 @@ def save_users(users: dict) -> None:
 
 # Global telemetry data
 telemetry_data = {
-    'proximity': [2500] * 8,  # 8 sectors in cm
+    'proximity': np.full(8, 2500, dtype=np.uint16) if PROXIMITY_ARRAY else [2500] * 8,  # 8 sectors in cm
     'system_status': {
         'proximity_bridge': 'Unknown',
         'data_relay': 'Unknown',
@@ -78,12 +171,102 @@ telemetry_data = {
     'statistics': {
         'uptime': 0,
         'messages_sent': 0,
-        'last_update': '',
+        'last_update': '',  # HH:MM:SS, kept for existing API consumers
+        'last_update_epoch': 0,  # epoch seconds; the page formats this one
         'rplidar_success_rate': 0,
         'realsense_fps': 0
     }
 }
 
+# Same bands as the radar: under 1m danger, under 3m warning, otherwise safe
+PROXIMITY_BANDS_CM = (100, 300)
+PROXIMITY_STATUS = ('danger', 'warning', 'safe')
+
+def summarize_proximity(distances):
+    """Closest distance, danger mask and per-sector band (0 danger, 1 warning, 2 safe)"""
+    if PROXIMITY_ARRAY:
+        bands = np.searchsorted(PROXIMITY_BANDS_CM, distances, side='right')
+        return {
+            'min_cm': int(distances.min()),
+            'danger': (bands == 0).astype(np.uint8),
+            'sector_status': bands.astype(np.uint8),
+            'alerts': int(np.count_nonzero(bands < 2)),
+            'status': PROXIMITY_STATUS[int(bands.min())],
+        }
+    bands = [0 if d < PROXIMITY_BANDS_CM[0] else 1 if d < PROXIMITY_BANDS_CM[1] else 2 for d in distances]
+    return {
+        'min_cm': min(distances, default=0),
+        'danger': [int(b == 0) for b in bands],
+        'sector_status': bands,
+        'alerts': sum(b < 2 for b in bands),
+        'status': PROXIMITY_STATUS[min(bands, default=2)],
+    }
+
+# Serialized telemetry is published as one (version, bytes) tuple so readers need no lock;
+# stream clients wait on the Condition until the version moves
+telemetry_changed = threading.Condition()
+telemetry_snapshot = (0, b'')
+# Everything but the radar fields, for pages that take the distances from /ws/proximity
+RADAR_FIELDS = ('proximity', 'proximity_summary')
+status_snapshot = (0, b'')
+TELEMETRY_ETAG_PREFIX = '%x-' % int(time.time())  # versions restart at 0 with the process
+SSE_KEEPALIVE = 15  # seconds between comment lines so proxies keep the stream open
+LONG_POLL_TIMEOUT = 30  # seconds /api/telemetry?since= holds a request waiting for a change
+# Radar distances for /ws/proximity: (version, 8 little-endian uint16 values in cm)
+proximity_snapshot = (0, b'')
+
+def pack_proximity(distances):
+    """Pack the eight sector distances into 16 bytes, clamped to the uint16 range"""
+    if PROXIMITY_ARRAY:
+        return distances.astype('<u2', copy=False).tobytes()
+    values = (list(distances) + [2500] * 8)[:8]
+    return struct.pack('<8H', *(min(max(int(d), 0), 65535) for d in values))
+
+def set_proximity(values):
+    """Store sector distances in cm, copying into the uint16 array when it is in use"""
+    values = (list(values) + [2500] * 8)[:8]
+    if PROXIMITY_ARRAY:
+        np.copyto(telemetry_data['proximity'], np.clip(values, 0, 65535), casting='unsafe')
+    else:
+        # A new list (update_proximity can't modify the caller's), clamped like the array path
+        telemetry_data['proximity'] = [min(max(int(v), 0), 65535) for v in values]
+
+def mark_updated():
+    """Stamp the statistics with the current time, formatting HH:MM:SS only when the second changes"""
+    now = int(time.time())
+    stats = telemetry_data['statistics']
+    if stats['last_update_epoch'] != now:
+        stats['last_update_epoch'] = now
+        stats['last_update'] = time.strftime('%H:%M:%S', time.localtime(now))
+
+def publish_telemetry():
+    """Wake stream clients if telemetry changed since the last publish"""
+    global telemetry_snapshot, status_snapshot, proximity_snapshot
+    # Serializing under the lock keeps a slower writer from swapping in an older payload;
+    # readers never take it, they just pick up whichever snapshot tuple is current
+    with telemetry_changed:
+        proximity = telemetry_data['proximity']
+        summary = telemetry_data['proximity_summary'] = summarize_proximity(proximity)
+        # The status fields are serialized once; the full payload splices the radar fields in front
+        status = json_dumps_bytes({k: v for k, v in telemetry_data.items() if k not in RADAR_FIELDS})
+        payload = (b'{"proximity":' + json_dumps_bytes(proximity) +
+                   b',"proximity_summary":' + json_dumps_bytes(summary) + b',' + status[1:])
+        frame = pack_proximity(proximity) if SOCK_AVAILABLE else b''
+        changed = False
+        if payload != telemetry_snapshot[1]:
+            telemetry_snapshot = (telemetry_snapshot[0] + 1, payload)
+            changed = True
+        if status != status_snapshot[1]:
+            status_snapshot = (status_snapshot[0] + 1, status)
+            changed = True
+        if frame != proximity_snapshot[1]:
+            proximity_snapshot = (proximity_snapshot[0] + 1, frame)
+            changed = True
+        if changed:
+            telemetry_changed.notify_all()
+
+publish_telemetry()
+
 # HTML template for dashboard
 DASHBOARD_HTML = '''
 <!DOCTYPE html>
@@ -288,6 +471,8 @@ DASHBOARD_HTML = '''
         }
         @keyframes spin { to { transform: rotate(360deg); } }
         .radar {
+            position: absolute;
+            inset: 0;
             width: 100%;
             height: 100%;
         }
@@ -480,6 +665,7 @@ DASHBOARD_HTML = '''
             <div class="panel">
                 <h2>PROXIMITY RADAR</h2>
                 <div class="radar-container">
+                    <canvas id="radar-bg" class="radar"></canvas>
                     <canvas id="radar" class="radar"></canvas>
                 </div>
                 <div class="env-container">
@@ -560,6 +746,10 @@ DASHBOARD_HTML = '''
         
         const canvas = document.getElementById('radar');
         const ctx = canvas.getContext('2d');
+        // Grid, labels and ticks live on a static canvas under the radar, redrawn only after a resize
+        const bgCanvas = document.getElementById('radar-bg');
+        const bgCtx = bgCanvas.getContext('2d');
+        let radarBgDirty = true;
         const envCanvas = document.getElementById('envmap');
         const envCtx = envCanvas ? envCanvas.getContext('2d') : null;
         const roomMap = document.getElementById('room-map');
@@ -571,6 +761,9 @@ DASHBOARD_HTML = '''
             const size = Math.min(container.clientWidth, 420);
             canvas.width = size;
             canvas.height = size;
+            bgCanvas.width = size;
+            bgCanvas.height = size;
+            radarBgDirty = true;
         }
         function resizeEnv() {
             if (!envCanvas) return;
@@ -591,7 +784,7 @@ DASHBOARD_HTML = '''
         resizeRoom();
         
         // Resize on window resize
-        window.addEventListener('resize', () => { resizeRadar(); resizeEnv(); resizeRoom(); });
+        window.addEventListener('resize', () => { resizeRadar(); resizeEnv(); resizeRoom(); redrawProximity(); });
         
         const centerX = canvas.width / 2;
         const centerY = canvas.height / 2;
@@ -606,49 +799,92 @@ DASHBOARD_HTML = '''
             'BACK', 'B-LEFT', 'LEFT', 'F-LEFT'
         ];
 
-        function drawRadar(distances) {
-            // Update center and radius for current canvas size
-            const currentCenterX = canvas.width / 2;
-            const currentCenterY = canvas.height / 2;
-            const currentMaxRadius = Math.min(canvas.width, canvas.height) / 2 - 20;
-            
-            ctx.clearRect(0, 0, canvas.width, canvas.height);
+        // Sector geometry never changes, so compute the arc angles and label direction once
+        const sectorStart = new Float32Array(8);
+        const sectorEnd = new Float32Array(8);
+        const sectorCos = new Float32Array(8);
+        const sectorSin = new Float32Array(8);
+        for (let i = 0; i < 8; i++) {
+            sectorStart[i] = (sectorAngles[i] - 90) * Math.PI / 180;
+            sectorEnd[i] = (sectorAngles[(i + 1) % 8] - 90) * Math.PI / 180;
+            const centerAngle = (sectorStart[i] + sectorEnd[i]) / 2;
+            sectorCos[i] = Math.cos(centerAngle);
+            sectorSin[i] = Math.sin(centerAngle);
+        }
+
+        // Distance bands: 0 = under 1m, 1 = under 3m, 2 = clear
+        const RADAR_COLOR_LUT = ['rgba(239, 68, 68, 0.65)', 'rgba(245, 158, 11, 0.50)', 'rgba(52, 211, 153, 0.30)'];
+        const CLASS_LUT = ['danger', 'warning', 'safe'];
+        function distanceBand(meters) {
+            return meters < 1 ? 0 : meters < 3 ? 1 : 2;
+        }
+
+        // Build the proximity value rows once; drawRadar only updates their text and class
+        const proximityBands = new Int8Array(8).fill(-1);
+        const proximityValueEls = sectorNames.map((name) => {
+            const item = document.createElement('div');
+            item.className = 'proximity-item';
+            const label = document.createElement('div');
+            label.className = 'proximity-label';
+            label.textContent = name;
+            const value = document.createElement('div');
+            item.appendChild(label);
+            item.appendChild(value);
+            document.getElementById('proximity-values').appendChild(item);
+            return value;
+        });
+
+        function drawRadarBg() {
+            const currentCenterX = bgCanvas.width / 2;
+            const currentCenterY = bgCanvas.height / 2;
+            const currentMaxRadius = Math.min(bgCanvas.width, bgCanvas.height) / 2 - 20;
+
+            bgCtx.clearRect(0, 0, bgCanvas.width, bgCanvas.height);
 
             // Draw grid circles
-            ctx.strokeStyle = 'rgba(110, 231, 183, 0.18)';
-            ctx.lineWidth = 1;
+            bgCtx.strokeStyle = 'rgba(110, 231, 183, 0.18)';
+            bgCtx.lineWidth = 1;
             for (let r = 0.25; r <= 1; r += 0.25) {
-                ctx.beginPath();
-                ctx.arc(currentCenterX, currentCenterY, currentMaxRadius * r, 0, Math.PI * 2);
-                ctx.stroke();
+                bgCtx.beginPath();
+                bgCtx.arc(currentCenterX, currentCenterY, currentMaxRadius * r, 0, Math.PI * 2);
+                bgCtx.stroke();
 
                 // Distance labels
-                ctx.fillStyle = 'rgba(230, 234, 242, 0.5)';
-                ctx.font = '11px system-ui, -apple-system, Segoe UI, Roboto, sans-serif';
-                ctx.fillText(`${Math.round(r * 25)}m`, currentCenterX + 5, currentCenterY - currentMaxRadius * r + 10);
+                bgCtx.fillStyle = 'rgba(230, 234, 242, 0.5)';
+                bgCtx.font = '11px system-ui, -apple-system, Segoe UI, Roboto, sans-serif';
+                bgCtx.fillText(`${Math.round(r * 25)}m`, currentCenterX + 5, currentCenterY - currentMaxRadius * r + 10);
             }
 
             // Draw sector lines / ticks
             for (let angle of sectorAngles) {
                 const rad = (angle - 90) * Math.PI / 180;
-                ctx.beginPath();
-                ctx.moveTo(currentCenterX, currentCenterY);
-                ctx.lineTo(
+                bgCtx.beginPath();
+                bgCtx.moveTo(currentCenterX, currentCenterY);
+                bgCtx.lineTo(
                     currentCenterX + currentMaxRadius * Math.cos(rad),
                     currentCenterY + currentMaxRadius * Math.sin(rad)
                 );
-                ctx.stroke();
+                bgCtx.stroke();
             }
             // Minor ticks every 15°
-            ctx.strokeStyle = 'rgba(110, 231, 183, 0.12)';
+            bgCtx.strokeStyle = 'rgba(110, 231, 183, 0.12)';
             for (let a = -180; a < 180; a += 15) {
                 const rad = (a - 90) * Math.PI / 180;
                 const inner = currentMaxRadius - 8;
-                ctx.beginPath();
-                ctx.moveTo(currentCenterX + inner * Math.cos(rad), currentCenterY + inner * Math.sin(rad));
-                ctx.lineTo(currentCenterX + currentMaxRadius * Math.cos(rad), currentCenterY + currentMaxRadius * Math.sin(rad));
-                ctx.stroke();
+                bgCtx.beginPath();
+                bgCtx.moveTo(currentCenterX + inner * Math.cos(rad), currentCenterY + inner * Math.sin(rad));
+                bgCtx.lineTo(currentCenterX + currentMaxRadius * Math.cos(rad), currentCenterY + currentMaxRadius * Math.sin(rad));
+                bgCtx.stroke();
             }
+        }
+
+        function drawRadar(distances) {
+            // Update center and radius for current canvas size
+            const currentCenterX = canvas.width / 2;
+            const currentCenterY = canvas.height / 2;
+            const currentMaxRadius = Math.min(canvas.width, canvas.height) / 2 - 20;
+            
+            ctx.clearRect(0, 0, canvas.width, canvas.height);
 
             // Draw obstacles
             for (let i = 0; i < 8; i++) {
@@ -656,32 +892,17 @@ DASHBOARD_HTML = '''
                 const normalizedDist = Math.min(distance / 25, 1); // Normalize to 25m max
                 const pixelDist = normalizedDist * currentMaxRadius;
 
-                // Calculate sector center angle
-                const startAngle = (sectorAngles[i] - 90) * Math.PI / 180;
-                const endAngle = (sectorAngles[(i + 1) % 8] - 90) * Math.PI / 180;
-                const centerAngle = (startAngle + endAngle) / 2;
-
-                // Color based on distance
-                let color;
-                if (distance < 1) {
-                    color = 'rgba(239, 68, 68, 0.65)'; // softer red
-                } else if (distance < 3) {
-                    color = 'rgba(245, 158, 11, 0.50)'; // amber
-                } else {
-                    color = 'rgba(52, 211, 153, 0.30)'; // mint
-                }
-
-                // Draw sector arc
-                ctx.fillStyle = color;
+                // Draw sector arc, colored by distance band
+                ctx.fillStyle = RADAR_COLOR_LUT[distanceBand(distance)];
                 ctx.beginPath();
-                ctx.arc(currentCenterX, currentCenterY, pixelDist, startAngle, endAngle);
+                ctx.arc(currentCenterX, currentCenterY, pixelDist, sectorStart[i], sectorEnd[i]);
                 ctx.lineTo(currentCenterX, currentCenterY);
                 ctx.fill();
 
                 // Draw distance text
                 if (distance < 25) {
-                    const textX = currentCenterX + (pixelDist + 15) * Math.cos(centerAngle);
-                    const textY = currentCenterY + (pixelDist + 15) * Math.sin(centerAngle);
+                    const textX = currentCenterX + (pixelDist + 15) * sectorCos[i];
+                    const textY = currentCenterY + (pixelDist + 15) * sectorSin[i];
                     ctx.fillStyle = 'rgba(230, 234, 242, 0.85)';
                     ctx.font = '600 12px system-ui, -apple-system, Segoe UI, Roboto, sans-serif';
                     ctx.fillText(`${distance.toFixed(1)}m`, textX - 15, textY + 3);
@@ -694,18 +915,19 @@ DASHBOARD_HTML = '''
             ctx.arc(currentCenterX, currentCenterY, 3, 0, Math.PI * 2);
             ctx.fill();
 
-            // Update proximity values panel
-            const valuesHtml = sectorNames.map((name, i) => {
+            // Update proximity values panel; only rows whose text or band changed are touched
+            // (0.96m and 1.04m both read "1.0m" but sit in different bands)
+            for (let i = 0; i < 8; i++) {
                 const dist = distances[i] / 100;
-                const className = dist < 1 ? 'danger' : dist < 3 ? 'warning' : 'safe';
-                return `
-                    <div class="proximity-item">
-                        <div class="proximity-label">${name}</div>
-                        <div class="proximity-value ${className}">${dist.toFixed(1)}m</div>
-                    </div>
-                `;
-            }).join('');
-            document.getElementById('proximity-values').innerHTML = valuesHtml;
+                const el = proximityValueEls[i];
+                const band = distanceBand(dist);
+                if (band !== proximityBands[i]) {
+                    proximityBands[i] = band;
+                    el.className = 'proximity-value ' + CLASS_LUT[band];
+                }
+                const text = `${dist.toFixed(1)}m`;
+                if (el.textContent !== text) el.textContent = text;
+            }
         }
 
         function drawEnvironment(distances) {
@@ -787,35 +1009,84 @@ DASHBOARD_HTML = '''
             else if (state === 'err') el.classList.add('on-err');
         }
 
+        // Status keys repeat every update, so format each one once
+        const DISPLAY_KEY = {};
+        function displayKeyFor(key) {
+            return DISPLAY_KEY[key] ?? (DISPLAY_KEY[key] = key.replace(/_/g, ' ').toUpperCase());
+        }
+        const STATUS_CLASS = new Map([
+            ['RUNNING', 'status-value status-ok'], ['Connected', 'status-value status-ok'], ['Good', 'status-value status-ok'],
+            ['Warning', 'status-value status-warning'], ['Degraded', 'status-value status-warning'],
+            ['ERROR', 'status-value status-error'], ['Disconnected', 'status-value status-error'], ['Failed', 'status-value status-error']
+        ]);
+
+        // Each panel keeps one label/value node pair per key; updates only touch values that changed
+        const statusNodes = {};
+        function setText(node, text) {
+            if (node.textContent !== text) node.textContent = text;
+        }
+
+        function formatEpoch(seconds) {
+            return seconds ? new Date(seconds * 1000).toLocaleTimeString([], {hour12: false}) : '--';
+        }
+
         function updateStatus(elementId, data) {
             const element = document.getElementById(elementId);
-            let html = '';
+            let nodes = statusNodes[elementId];
+            if (!nodes) {
+                nodes = statusNodes[elementId] = {};
+                element.textContent = '';
+            }
 
             for (const [key, value] of Object.entries(data)) {
-                const displayKey = key.replace(/_/g, ' ').toUpperCase();
-                let displayValue = value;
-                let className = 'status-value';
-
-                // Apply color coding
-                if (value === 'RUNNING' || value === 'Connected' || value === 'Good') {
-                    className += ' status-ok';
-                } else if (value === 'Warning' || value === 'Degraded') {
-                    className += ' status-warning';
-                } else if (value === 'ERROR' || value === 'Disconnected' || value === 'Failed') {
-                    className += ' status-error';
+                // Shown through last_update instead of as its own row
+                if (key === 'last_update_epoch') continue;
+                let node = nodes[key];
+                if (!node) {
+                    const label = document.createElement('div');
+                    label.className = 'status-label';
+                    label.textContent = `${displayKeyFor(key)}:`;
+                    node = nodes[key] = document.createElement('div');
+                    node.className = 'status-value';
+                    element.append(label, node);
+                }
+                const text = key === 'last_update' && 'last_update_epoch' in data
+                    ? formatEpoch(data.last_update_epoch) : String(value);
+                if (node.textContent !== text) {
+                    node.textContent = text;
+                    // Apply color coding
+                    node.className = STATUS_CLASS.get(value) || 'status-value';
                 }
-
-                html += `
-                    <div class="status-label">${displayKey}:</div>
-                    <div class="${className}">${displayValue}</div>
-                `;
             }
-
-            element.innerHTML = html;
         }
 
         let lastCropCaptureCount = 0;
         let lastImageUpdate = 0;
+        let cropStatusNodes = null;
+
+        function buildCropStatus(statusElement) {
+            statusElement.textContent = '';
+            const field = (label, id) => {
+                const row = document.createElement('div');
+                const value = document.createElement('span');
+                if (id) value.id = id;
+                row.append(label, value);
+                statusElement.append(row);
+                return value;
+            };
+            const nodes = {
+                status: field('Status: '),
+                captures: field('Captures: '),
+                last: field('Last: '),
+                size: field('Size: '),
+                age: field('Age: ')
+            };
+            // Keep the slot counter that refreshRoverVision updates
+            field('Slot: ', 'current-slot').after('/10');
+            field('Refresh: ').textContent = 'Every 5s';
+            nodes.updated = field('Updated: ');
+            return nodes;
+        }
         
         function updateCropMonitor(cropData) {
             const statusElement = document.getElementById('crop-status');
@@ -838,26 +1109,54 @@ DASHBOARD_HTML = '''
             let statusClass = 'status-ok';
             if (cropData.status === 'WARNING') statusClass = 'status-warning';
             if (cropData.status === 'STOPPED' || cropData.status === 'ERROR') statusClass = 'status-error';
-            
-            let statusHtml = `
-                <div>Status: <span class="${statusClass}">${cropData.status}</span></div>
-                <div>Captures: ${cropData.capture_count}</div>
-                <div>Last: ${cropData.last_capture}</div>
-                <div>Size: ${Math.round(cropData.image_size / 1024)}KB</div>
-                <div>Age: ${cropData.image_age || 0}s</div>
-                <div>Refresh: Every 5s</div>
-                <div>Updated: ${new Date().toLocaleTimeString()}</div>
-            `;
-            statusElement.innerHTML = statusHtml;
-        }
-
-        async function updateDashboard() {
-            try {
-                const response = await fetch('/api/telemetry');
-                const data = await response.json();
 
-                // Update radar
-                drawRadar(data.proximity);
+            if (!cropStatusNodes) {
+                const slot = currentSlot;
+                cropStatusNodes = buildCropStatus(statusElement);
+                // refreshRoverVision has already advanced past the slot it last showed
+                document.getElementById('current-slot').textContent = ((slot + 8) % 10) + 1;
+            }
+            const nodes = cropStatusNodes;
+            nodes.status.className = statusClass;
+            setText(nodes.status, String(cropData.status));
+            setText(nodes.captures, String(cropData.capture_count));
+            setText(nodes.last, String(cropData.last_capture));
+            setText(nodes.size, `${Math.round(cropData.image_size / 1024)}KB`);
+            setText(nodes.age, `${cropData.image_age || 0}s`);
+            setText(nodes.updated, new Date().toLocaleTimeString());
+        }
+
+        // Canvases redraw on the next animation frame, and only when the distances changed
+        let pendingDistances = [2500, 2500, 2500, 2500, 2500, 2500, 2500, 2500];
+        let lastDistancesKey = '';
+        let frameRequested = false;
+        function drawProximityFrame() {
+            frameRequested = false;
+            if (radarBgDirty) {
+                drawRadarBg();
+                radarBgDirty = false;
+            }
+            drawRadar(pendingDistances);
+            drawEnvironment(pendingDistances);
+            drawRoomBoundary(pendingDistances);
+        }
+        function redrawProximity() {
+            if (frameRequested) return;
+            frameRequested = true;
+            requestAnimationFrame(drawProximityFrame);
+        }
+        function scheduleProximityDraw(distances) {
+            const key = distances.join(',');
+            if (key === lastDistancesKey) return;
+            lastDistancesKey = key;
+            pendingDistances = distances;
+            redrawProximity();
+        }
+
+        function renderTelemetry(data) {
+            try {
+                // Update radar and environment visuals
+                if (data.proximity) scheduleProximityDraw(data.proximity);
 
                 // Update status panels
                 updateStatus('system-status', data.system_status);
@@ -879,10 +1178,6 @@ DASHBOARD_HTML = '''
                     updateCropMonitor(data.crop_monitor);
                 }
 
-                // Update environment visuals
-                drawEnvironment(data.proximity);
-                drawRoomBoundary(data.proximity);
-
                 // Update timestamp
                 document.getElementById('timestamp').textContent =
                     new Date().toLocaleTimeString();
@@ -901,11 +1196,72 @@ DASHBOARD_HTML = '''
             }
         }
 
+        // Long-poll fallback: the server answers as soon as telemetry differs from our ETag, or 304 after 30s
+        async function longPollTelemetry() {
+            let etag = '';
+            while (true) {
+                try {
+                    const response = await fetch('/api/telemetry?since=' + encodeURIComponent(etag));
+                    if (response.status === 200) {
+                        etag = response.headers.get('ETag') || '';
+                        renderTelemetry(await response.json());
+                    } else if (response.status !== 304) {
+                        throw new Error(`HTTP ${response.status}`);
+                    }
+                } catch (error) {
+                    console.error('Failed to update dashboard:', error);
+                    await new Promise((resolve) => setTimeout(resolve, 1000));
+                }
+            }
+        }
+
         // Initial draw
-        drawRadar([2500, 2500, 2500, 2500, 2500, 2500, 2500, 2500]);
+        redrawProximity();
+
+        // Server pushes telemetry on change; long-poll only if the stream is unavailable
+        let polling = false;
+        function startPolling() {
+            if (polling) return;
+            polling = true;
+            longPollTelemetry();
+        }
+        let telemetryStream = null;
+        function openTelemetryStream(radarOverSocket) {
+            if (polling || !window.EventSource) return;
+            if (telemetryStream) telemetryStream.close();
+            const stream = new EventSource('/api/telemetry/stream' + (radarOverSocket ? '?radar=ws' : ''));
+            stream.onmessage = (e) => renderTelemetry(JSON.parse(e.data));
+            stream.onerror = () => {
+                if (stream.readyState === EventSource.CLOSED && stream === telemetryStream) startPolling();
+            };
+            telemetryStream = stream;
+        }
+        if (window.EventSource) {
+            openTelemetryStream(false);
+        } else {
+            startPolling();
+        }
 
-        // Update every 1 second
-        setInterval(updateDashboard, 1000);
+        // With /ws/proximity the radar arrives as 8 uint16 (cm) binary frames and the stream drops
+        // its distances; without flask-sock the socket never opens and the JSON stream keeps them
+        function connectProximitySocket() {
+            if (!window.WebSocket) return;
+            const ws = new WebSocket(`${location.protocol === 'https:' ? 'wss' : 'ws'}://${location.host}/ws/proximity`);
+            let opened = false;
+            ws.binaryType = 'arraybuffer';
+            ws.onopen = () => {
+                opened = true;
+                openTelemetryStream(true);
+            };
+            ws.onmessage = (e) => scheduleProximityDraw(new Uint16Array(e.data));
+            ws.onclose = () => {
+                if (!opened) return;
+                // Put the distances back on the stream until the socket reconnects
+                openTelemetryStream(false);
+                setTimeout(connectProximitySocket, 3000);
+            };
+        }
+        connectProximitySocket();
 
         // Vision toggle logic
         const btnLive = document.getElementById('btn-live');
@@ -965,11 +1321,43 @@ DASHBOARD_HTML = '''
 </html>
 '''
 
+def minify_page(html):
+    """Minify the inline <style> and <script> blocks and drop markup indentation"""
+    if MINIFY_AVAILABLE:
+        html = re.sub(r'(<style>)(.*?)(</style>)', lambda m: m.group(1) + cssmin(m.group(2)) + m.group(3), html, flags=re.S)
+        html = re.sub(r'(<script>)(.*?)(</script>)', lambda m: m.group(1) + jsmin(m.group(2)) + m.group(3), html, flags=re.S)
+    # Outside <style>/<script>, a whitespace run renders the same as a single newline
+    parts = re.split(r'(<(?:style|script)\b.*?</(?:style|script)>)', html, flags=re.S)
+    parts[::2] = [re.sub(r'\s*\n\s*', '\n', part) for part in parts[::2]]
+    return ''.join(parts)
+
+# The dashboard has no template variables, so render, minify and compress it once
+with app.app_context():
+    INDEX_BYTES = minify_page(render_template_string(DASHBOARD_HTML)).encode('utf-8')
+INDEX_GZ = gzip.compress(INDEX_BYTES, 9)
+INDEX_BR = brotli.compress(INDEX_BYTES, quality=11) if BROTLI_AVAILABLE else None
+INDEX_ETAG = hashlib.md5(INDEX_BYTES).hexdigest()
+
 @app.route('/')
 def index():
     if not session.get('user'):
         return redirect(url_for('login'))
-    return render_template_string(DASHBOARD_HTML)
+    # Each encoding gets its own ETag so caches never mix them up
+    if INDEX_BR is not None and 'br' in request.accept_encodings:
+        resp = Response(INDEX_BR, mimetype='text/html')
+        resp.headers['Content-Encoding'] = 'br'
+        resp.set_etag(INDEX_ETAG + '-br')
+    elif 'gzip' in request.accept_encodings:
+        resp = Response(INDEX_GZ, mimetype='text/html')
+        resp.headers['Content-Encoding'] = 'gzip'
+        resp.set_etag(INDEX_ETAG + '-gz')
+    else:
+        resp = Response(INDEX_BYTES, mimetype='text/html')
+        resp.set_etag(INDEX_ETAG)
+    resp.headers['Vary'] = 'Accept-Encoding'
+    # private: the page sits behind the login, so shared caches must not keep it
+    resp.headers['Cache-Control'] = 'private, max-age=60'
+    return resp.make_conditional(request)
 
 LOGIN_HTML = '''
 <!DOCTYPE html>
@@ -1051,119 +1439,213 @@ def signup():
 @app.route('/api/telemetry')
 def get_telemetry():
     """Return current telemetry data as JSON"""
-    return jsonify(telemetry_data)
+    since = request.args.get('since')
+    if since is not None:
+        # Long poll: hold the request until telemetry moves past the client's ETag
+        since = since.strip('"')
+        with telemetry_changed:
+            telemetry_changed.wait_for(lambda: f"{TELEMETRY_ETAG_PREFIX}{telemetry_snapshot[0]}" != since,
+                                       LONG_POLL_TIMEOUT)
+    version, payload = telemetry_snapshot
+    etag = f"{TELEMETRY_ETAG_PREFIX}{version}"
+    if etag == since:
+        resp = Response(status=304)
+    else:
+        resp = Response(payload, mimetype='application/json')
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'no-cache'
+    return resp.make_conditional(request)
+
+@app.route('/api/telemetry/stream')
+def telemetry_stream():
+    """Push telemetry as server-sent events whenever it changes"""
+    # ?radar=ws: the page has /ws/proximity open, so leave the distances out and
+    # don't wake it for radar-only changes
+    if SOCK_AVAILABLE and request.args.get('radar') == 'ws':
+        current = lambda: status_snapshot
+    else:
+        current = lambda: telemetry_snapshot
+
+    def gen():
+        seen = -1
+        while True:
+            with telemetry_changed:
+                changed = telemetry_changed.wait_for(lambda: current()[0] != seen, SSE_KEEPALIVE)
+            if changed:
+                seen, payload = current()
+                yield b"data: " + payload + b"\n\n"
+            else:
+                yield b": keepalive\n\n"
+
+    resp = Response(gen(), mimetype='text/event-stream')
+    resp.headers['Cache-Control'] = 'no-cache'
+    resp.headers['X-Accel-Buffering'] = 'no'
+    return resp
+
+if SOCK_AVAILABLE:
+    @sock.route('/ws/proximity')
+    def proximity_socket(ws):
+        """Send the radar distances as a 16-byte binary frame whenever they change"""
+        seen = -1
+        while ws.connected:
+            with telemetry_changed:
+                changed = telemetry_changed.wait_for(lambda: proximity_snapshot[0] != seen, SSE_KEEPALIVE)
+            if changed:
+                seen, frame = proximity_snapshot
+                ws.send(frame)
 
 @app.route('/api/proximity/<int:sector>/<int:distance>')
 def update_proximity(sector, distance):
-    """Update proximity data for a specific sector"""
+    """Update proximity data for a specific sector (one request per sector; prefer /api/proximity/bulk)"""
     if 0 <= sector < 8:
-        telemetry_data['proximity'][sector] = distance
-        telemetry_data['statistics']['last_update'] = datetime.now().strftime('%H:%M:%S')
+        # The Condition's RLock lets publish_telemetry re-enter it, so the
+        # sector and its timestamp land in the same snapshot
+        with telemetry_changed:
+            telemetry_data['proximity'][sector] = min(distance, 65535)
+            mark_updated()
+            publish_telemetry()
     return jsonify({'status': 'ok'})
 
+@app.route('/api/proximity/bulk', methods=['POST'])
+def update_proximity_bulk():
+    """Update all 8 sectors at once from 16 little-endian uint16 bytes or a JSON array (cm)"""
+    if request.mimetype == 'application/json':
+        values = request.get_json(silent=True)
+        if not isinstance(values, list) or len(values) != 8:
+            return jsonify({'error': 'expected a list of 8 distances'}), 400
+        try:
+            values = [int(v) for v in values]
+        except (TypeError, ValueError):
+            return jsonify({'error': 'distances must be numbers'}), 400
+    else:
+        body = request.get_data(cache=False)
+        if len(body) != 16:
+            return jsonify({'error': 'expected 16 bytes'}), 400
+        values = np.frombuffer(body, dtype='<u2') if PROXIMITY_ARRAY else struct.unpack('<8H', body)
+    with telemetry_changed:
+        set_proximity(values)
+        mark_updated()
+        publish_telemetry()
+    return jsonify({'status': 'ok'})
+
+# Behind nginx set e.g. ASTRA_ACCEL_REDIRECT=/protected/ with
+#   location /protected/ { internal; alias /tmp/; }
+# so the proxy sendfile()s images straight from the page cache
+ACCEL_REDIRECT_PREFIX = os.environ.get('ASTRA_ACCEL_REDIRECT', '')
+
+def send_jpeg(path):
+    """Serve a JPEG under /tmp, revalidated by an mtime/size ETag"""
+    if ACCEL_REDIRECT_PREFIX:
+        # nginx handles the body and If-None-Match itself; stat so a missing file still raises here
+        os.stat(path)
+        resp = Response(mimetype='image/jpeg')
+        resp.headers['X-Accel-Redirect'] = ACCEL_REDIRECT_PREFIX + os.path.relpath(path, '/tmp')
+    else:
+        f = open(path, 'rb')
+        st = os.fstat(f.fileno())
+        resp = send_file(f, mimetype='image/jpeg', etag=f"{st.st_mtime_ns:x}-{st.st_size:x}",
+                         last_modified=st.st_mtime, conditional=True)
+    resp.headers['Cache-Control'] = 'max-age=0, must-revalidate'
+    return resp
+
+def newest_archive_image():
+    """Path of the newest crop_*.jpg in the archive, or None"""
+    # Names carry a sortable timestamp, so one scandir pass keeping the max name is enough
+    latest = None
+    try:
+        with os.scandir('/tmp/crop_archive') as it:
+            for e in it:
+                if e.name.startswith('crop_') and e.name.endswith('.jpg') and (latest is None or e.name > latest):
+                    latest = e.name
+    except FileNotFoundError:
+        return None
+    return os.path.join('/tmp/crop_archive', latest) if latest else None
+
+@lru_cache(maxsize=1)
+def placeholder_font():
+    """Load the placeholder font once for all slots"""
+    try:
+        return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
+    except:
+        return ImageFont.load_default()
+
+@lru_cache(maxsize=10)
+def render_placeholder(slot):
+    """JPEG bytes for an empty slot, drawn once per slot"""
+    # Create a 640x480 placeholder image
+    img = Image.new('RGB', (640, 480), color='black')
+    draw = ImageDraw.Draw(img)
+    
+    # Add text
+    font = placeholder_font()
+    
+    text = f"ROVER VISION\nSlot {slot} loading..."
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+    
+    x = (640 - text_width) // 2
+    y = (480 - text_height) // 2
+    
+    draw.text((x, y), text, fill='green', font=font)
+    
+    # Convert to bytes
+    img_byte_arr = io.BytesIO()
+    img.save(img_byte_arr, format='JPEG')
+    return img_byte_arr.getvalue()
+
 @app.route('/api/crop/image/<int:slot>')
 def get_crop_image(slot):
     """Serve a specific slot from the rolling buffer (1-10)"""
-    from flask import send_file, Response
-    import os
-    import io
-    import glob
-    from PIL import Image, ImageDraw, ImageFont
-    
     # Validate slot number
     if slot < 1 or slot > 10:
         slot = 1
     
     image_path = f"/tmp/rover_vision/{slot}.jpg"
     
-    # Try the rolling buffer first
-    if os.path.exists(image_path):
-        try:
-            with open(image_path, 'rb') as f:
-                img_data = f.read()
-            
-            response = Response(img_data, mimetype='image/jpeg')
-            response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate, max-age=0'
-            response.headers['Pragma'] = 'no-cache'
-            response.headers['Expires'] = '0'
-            return response
-        except Exception as e:
-            print(f"Error reading crop image slot {slot}: {e}")
+    # Try the rolling buffer first; send_jpeg's open() doubles as the existence check
+    try:
+        return send_jpeg(image_path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error reading crop image slot {slot}: {e}")
     
     # Fallback: try to get the latest image from archive
     try:
-        archive_images = sorted(glob.glob('/tmp/crop_archive/crop_*.jpg'), reverse=True)
-        if archive_images:
-            with open(archive_images[0], 'rb') as f:
-                img_data = f.read()
-            
-            response = Response(img_data, mimetype='image/jpeg')
-            response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate, max-age=0'
-            response.headers['Pragma'] = 'no-cache'
-            response.headers['Expires'] = '0'
-            return response
+        archive_image = newest_archive_image()
+        if archive_image:
+            return send_jpeg(archive_image)
     except Exception as e:
         print(f"Error reading archive image: {e}")
     
-    # If all else fails, create a placeholder image
+    # If all else fails, serve a placeholder image
+    if not PIL_AVAILABLE:
+        return "No crop image available", 404
     try:
-        # Create a 640x480 placeholder image
-        img = Image.new('RGB', (640, 480), color='black')
-        draw = ImageDraw.Draw(img)
-        
-        # Add text
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 24)
-        except:
-            font = ImageFont.load_default()
-        
-        text = f"ROVER VISION\nSlot {slot} loading..."
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        
-        x = (640 - text_width) // 2
-        y = (480 - text_height) // 2
-        
-        draw.text((x, y), text, fill='green', font=font)
-        
-        # Convert to bytes
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format='JPEG')
-        img_byte_arr.seek(0)
-        
-        return Response(img_byte_arr.getvalue(), mimetype='image/jpeg')
+        return Response(render_placeholder(slot), mimetype='image/jpeg')
     except:
         return "No crop image available", 404
 
 @app.route('/api/crop/latest')
 def get_crop_latest():
     """Serve the most recent image from rolling buffer or archive"""
-    from flask import Response
-    import glob
     try:
         # Prefer the most recently modified file in /tmp/rover_vision
-        vision_files = sorted(glob.glob('/tmp/rover_vision/*.jpg'), key=os.path.getmtime, reverse=True)
-        if vision_files:
-            with open(vision_files[0], 'rb') as f:
-                data = f.read()
-            resp = Response(data, mimetype='image/jpeg')
-            resp.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate, max-age=0'
-            return resp
+        if os.path.isdir('/tmp/rover_vision'):
+            with os.scandir('/tmp/rover_vision') as it:
+                newest = max((e for e in it if e.name.endswith('.jpg')), key=lambda e: e.stat().st_mtime, default=None)
+            if newest is not None:
+                return send_jpeg(newest.path)
         # Fallback to crop archive
-        archive_files = sorted(glob.glob('/tmp/crop_archive/crop_*.jpg'), reverse=True)
-        if archive_files:
-            with open(archive_files[0], 'rb') as f:
-                data = f.read()
-            resp = Response(data, mimetype='image/jpeg')
-            resp.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate, max-age=0'
-            return resp
+        archive_image = newest_archive_image()
+        if archive_image:
+            return send_jpeg(archive_image)
     except Exception as e:
         print(f"Error serving latest crop image: {e}")
     return "No latest image", 404
 
 def mjpeg_generator(shared_image_path: str):
-    import time
     last_mtime = 0
     while True:
         try:
@@ -1194,7 +1676,6 @@ def mjpeg_generator(shared_image_path: str):
 @app.route('/api/stream')
 def api_stream():
     """MJPEG stream directly from shared RealSense frame without camera access."""
-    from flask import Response
     shared = '/tmp/realsense_latest.jpg'
     if not os.path.exists(shared):
         return "No stream source", 404
@@ -1203,7 +1684,6 @@ def api_stream():
 @app.route('/api/crop/gallery')
 def crop_gallery():
     """Simple gallery page to browse crop images"""
-    import glob
     files = sorted(glob.glob('/tmp/crop_archive/crop_*.jpg'), key=os.path.getmtime, reverse=True)
     items = []
     for fp in files[:300]:
@@ -1231,19 +1711,12 @@ def crop_gallery():
 @app.route('/api/crop/archive/<path:filename>')
 def serve_archive_file(filename):
     """Serve a specific archived image safely from /tmp/crop_archive"""
-    from flask import send_file, abort, Response
     safe_dir = '/tmp/crop_archive'
     full_path = os.path.join(safe_dir, os.path.basename(filename))
     if not os.path.exists(full_path):
         return abort(404)
     try:
-        with open(full_path, 'rb') as f:
-            data = f.read()
-        resp = Response(data, mimetype='image/jpeg')
-        resp.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate, max-age=0'
-        resp.headers['Pragma'] = 'no-cache'
-        resp.headers['Expires'] = '0'
-        return resp
+        return send_jpeg(full_path)
     except Exception as e:
         print(f"Error serving archive file: {e}")
         return abort(404)
@@ -1251,7 +1724,6 @@ def serve_archive_file(filename):
 @app.route('/api/crop/list')
 def crop_list():
     """Return JSON list of archived images with timestamps"""
-    import glob
     files = sorted(glob.glob('/tmp/crop_archive/crop_*.jpg'), key=os.path.getmtime, reverse=True)
     out = []
     for fp in files[:300]:
@@ -1267,18 +1739,13 @@ def crop_list():
 @app.route('/api/crop/status')
 def get_crop_status():
     """Get crop monitor status"""
-    import os
-    import json
-    import time
-    
     status_file = "/tmp/crop_monitor_v8.json"
     if os.path.exists(status_file):
         try:
-            with open(status_file, 'r') as f:
-                data = json.load(f)
-                # Add file modification time
-                data['status_file_age'] = time.time() - os.path.getmtime(status_file)
-                return jsonify(data)
+            data = dict(load_status_file(status_file))
+            # Add file modification time
+            data['status_file_age'] = time.time() - os.path.getmtime(status_file)
+            return Response(json_dumps_bytes(data), mimetype='application/json')
         except Exception as e:
             return jsonify({'error': f'Failed to read status file: {e}'})
     
@@ -1297,103 +1764,135 @@ def get_crop_status():
         'status': 'crop_monitor_not_running'
     })
 
-def read_telemetry_file():
-    """Read telemetry from shared file (if proximity bridge writes to file)"""
-    while True:
+TELEMETRY_FILES = ('proximity_v8.json', 'crop_monitor_v8.json')
+TELEMETRY_REFRESH = 5.0  # seconds; ages and staleness still need re-checking when nothing is written
+TELEMETRY_MIN_INTERVAL = 0.5  # seconds; the bridge rewrites its file at 10Hz, refresh no faster than the old poll
+status_file_cache = {}  # path -> ((st_mtime_ns, st_size), parsed JSON)
+proximity_data_seen = None  # last proximity parse refresh_telemetry applied; same object means unchanged
+# Status files are read into one reusable buffer; the lock covers request threads sharing it
+status_read_buf = bytearray(8192)
+status_read_lock = threading.Lock()
+
+def load_status_file(path):
+    """Parse a JSON status file, reusing the last result while its mtime and size are unchanged"""
+    global status_read_buf
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = status_file_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with status_read_lock:
+        if st.st_size >= len(status_read_buf):
+            status_read_buf = bytearray(st.st_size * 2)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            n = os.readv(fd, [status_read_buf])
+        finally:
+            os.close(fd)
+        view = memoryview(status_read_buf)[:n]
+        try:
+            # stdlib json can't parse a memoryview
+            data = json_loads(view if ORJSON_AVAILABLE else bytes(view))
+        finally:
+            view.release()
+    status_file_cache[path] = (key, data)
+    return data
+
+def set_crop_monitor(status, capture_count, last_capture, image_size, image_age):
+    """Update the crop monitor entry in place rather than replacing the dict"""
+    cm = telemetry_data.setdefault('crop_monitor', {})
+    cm['status'] = status
+    cm['capture_count'] = capture_count
+    cm['last_capture'] = last_capture
+    cm['image_size'] = image_size
+    cm['image_age'] = image_age
+
+def refresh_telemetry():
+    """Reload telemetry from the shared status files and publish any change"""
+    global proximity_data_seen
+    # Held across the whole refresh (the Condition's RLock lets publish_telemetry re-enter it)
+    # so a route publishing concurrently never serializes a half-applied refresh; the status
+    # files are small and usually served from load_status_file's cache
+    with telemetry_changed:
         # FIX BUG #14: Better error handling for file read failures
         try:
-            with open('/tmp/proximity_v8.json', 'r') as f:
-                data = json.load(f)
-                telemetry_data['proximity'] = data.get('sectors_cm', [2500] * 8)
-                telemetry_data['statistics']['messages_sent'] = data.get('messages_sent', 0)
-                telemetry_data['statistics']['last_update'] = datetime.now().strftime('%H:%M:%S')
-                
-                # Update system status based on data availability
-                telemetry_data['system_status'] = {
-                    'proximity_bridge': 'RUNNING' if data.get('sectors_cm') else 'STOPPED',
-                    'data_relay': 'RUNNING',  # Assume running if dashboard is up
-                    'crop_monitor': 'RUNNING'  # Assume running if dashboard is up
-                }
-                
-                # Calculate success rates for sensors
-                lidar_attempts = data.get('lidar_attempts', 0)
-                lidar_success = data.get('lidar_success', 0)
-                if lidar_attempts > 0:
-                    telemetry_data['statistics']['rplidar_success_rate'] = int((lidar_success / lidar_attempts) * 100)
-                else:
-                    telemetry_data['statistics']['rplidar_success_rate'] = 0
-                
-                # Update sensor health based on error counts
-                lidar_errors = data.get('lidar_errors', 0)
-                telemetry_data['sensor_health'] = {
-                    'rplidar': 'Good' if lidar_errors == 0 else 'Warning' if lidar_errors < 5 else 'Error',
-                    'realsense': 'Connected' if data.get('realsense_cm') else 'Disconnected',
-                    'pixhawk': 'Connected'  # Assume connected if messages are being sent
-                }
-                
-                # Update additional statistics
-                if 'timestamp' in data:
-                    age = time.time() - data['timestamp']
-                    telemetry_data['statistics']['uptime'] = int(age)
-                
-                # Update crop monitor status
+            data = load_status_file('/tmp/proximity_v8.json')
+            # load_status_file hands back the cached object while the file is unchanged; only a new
+            # parse restamps the times, so the periodic refresh doesn't publish a fake change
+            fresh = data is not proximity_data_seen
+            proximity_data_seen = data
+            set_proximity(data.get('sectors_cm', [2500] * 8))
+            telemetry_data['statistics']['messages_sent'] = data.get('messages_sent', 0)
+            if fresh:
+                mark_updated()
+
+            # Update system status based on data availability
+            system_status = telemetry_data['system_status']
+            system_status['proximity_bridge'] = 'RUNNING' if data.get('sectors_cm') else 'STOPPED'
+            system_status['data_relay'] = 'RUNNING'  # Assume running if dashboard is up
+            system_status['crop_monitor'] = 'RUNNING'  # Assume running if dashboard is up
+
+            # Calculate success rates for sensors
+            lidar_attempts = data.get('lidar_attempts', 0)
+            lidar_success = data.get('lidar_success', 0)
+            if lidar_attempts > 0:
+                telemetry_data['statistics']['rplidar_success_rate'] = int((lidar_success / lidar_attempts) * 100)
+            else:
+                telemetry_data['statistics']['rplidar_success_rate'] = 0
+
+            # Update sensor health based on error counts
+            lidar_errors = data.get('lidar_errors', 0)
+            sensor_health = telemetry_data['sensor_health']
+            sensor_health['rplidar'] = 'Good' if lidar_errors == 0 else 'Warning' if lidar_errors < 5 else 'Error'
+            sensor_health['realsense'] = 'Connected' if data.get('realsense_cm') else 'Disconnected'
+            sensor_health['pixhawk'] = 'Connected'  # Assume connected if messages are being sent
+
+            # Update additional statistics
+            if fresh and 'timestamp' in data:
+                age = time.time() - data['timestamp']
+                telemetry_data['statistics']['uptime'] = int(age)
+
+            # Update crop monitor status
+            try:
+                crop_status_file = "/tmp/crop_monitor_v8.json"
+                crop_image_file = "/tmp/crop_latest.jpg"
+
                 try:
-                    crop_status_file = "/tmp/crop_monitor_v8.json"
-                    crop_image_file = "/tmp/crop_latest.jpg"
-                    
-                    if os.path.exists(crop_status_file):
-                        with open(crop_status_file, 'r') as f:
-                            crop_data = json.load(f)
-                            # Check if image file exists and is recent
-                            image_exists = os.path.exists(crop_image_file)
-                            image_age = 0
-                            if image_exists:
-                                image_age = time.time() - os.path.getmtime(crop_image_file)
-                            
-                            # Determine status based on data freshness
-                            if image_age < 10:  # Image is less than 10 seconds old
-                                status = 'RUNNING'
-                            elif image_age < 60:  # Image is less than 1 minute old
-                                status = 'WARNING'
-                            else:
-                                status = 'STOPPED'
-                                
-                            telemetry_data['crop_monitor'] = {
-                                'status': status,
-                                'capture_count': crop_data.get('capture_count', 0),
-                                'last_capture': crop_data.get('timestamp', 'Unknown'),
-                                'image_size': crop_data.get('image_size', 0),
-                                'image_age': int(image_age)
-                            }
+                    crop_data = load_status_file(crop_status_file)
+                except FileNotFoundError:
+                    crop_data = None
+                if crop_data is not None:
+                    # Check if image file exists and is recent
+                    image_exists = os.path.exists(crop_image_file)
+                    image_age = 0
+                    if image_exists:
+                        image_age = time.time() - os.path.getmtime(crop_image_file)
+
+                    # Determine status based on data freshness
+                    if image_age < 10:  # Image is less than 10 seconds old
+                        status = 'RUNNING'
+                    elif image_age < 60:  # Image is less than 1 minute old
+                        status = 'WARNING'
                     else:
-                        telemetry_data['crop_monitor'] = {
-                            'status': 'STOPPED',
-                            'capture_count': 0,
-                            'last_capture': 'Never',
-                            'image_size': 0,
-                            'image_age': 999
-                        }
-                except Exception as e:
-                    telemetry_data['crop_monitor'] = {
-                        'status': 'ERROR',
-                        'capture_count': 0,
-                        'last_capture': f'Error: {str(e)[:20]}',
-                        'image_size': 0,
-                        'image_age': 999
-                    }
-                    
+                        status = 'STOPPED'
+
+                    set_crop_monitor(status, crop_data.get('capture_count', 0), crop_data.get('timestamp', 'Unknown'),
+                                     crop_data.get('image_size', 0), int(image_age))
+                else:
+                    set_crop_monitor('STOPPED', 0, 'Never', 0, 999)
+            except Exception as e:
+                set_crop_monitor('ERROR', 0, f'Error: {str(e)[:20]}', 0, 999)
+
         except FileNotFoundError:
             # File doesn't exist yet - expected on startup
-            telemetry_data['system_status'] = {
-                'proximity_bridge': 'STOPPED',
-                'data_relay': 'Unknown',
-                'crop_monitor': 'Unknown'
-            }
-            telemetry_data['sensor_health'] = {
-                'rplidar': 'Unknown',
-                'realsense': 'Unknown',
-                'pixhawk': 'Unknown'
-            }
+            system_status = telemetry_data['system_status']
+            system_status['proximity_bridge'] = 'STOPPED'
+            system_status['data_relay'] = 'Unknown'
+            system_status['crop_monitor'] = 'Unknown'
+            sensor_health = telemetry_data['sensor_health']
+            sensor_health['rplidar'] = 'Unknown'
+            sensor_health['realsense'] = 'Unknown'
+            sensor_health['pixhawk'] = 'Unknown'
         except PermissionError as e:
             print(f"[ERROR] Permission denied reading telemetry file: {e}")
         except json.JSONDecodeError as e:
@@ -1401,39 +1900,72 @@ def read_telemetry_file():
         except Exception as e:
             print(f"[ERROR] Unexpected error reading telemetry: {e}")
 
+        publish_telemetry()
+
+def read_telemetry_file():
+    """Read telemetry from shared file (if proximity bridge writes to file)"""
+    if INOTIFY_AVAILABLE:
+        try:
+            with INotify() as inotify:
+                # Both writers rename a temp file into place; other /tmp writes are filtered by name
+                inotify.add_watch('/tmp', flags.CLOSE_WRITE | flags.MOVED_TO)
+                read_delay = int(TELEMETRY_MIN_INTERVAL * 1000)
+                while True:
+                    refresh_telemetry()
+                    deadline = time.monotonic() + TELEMETRY_REFRESH
+                    while True:
+                        wait_ms = int((deadline - time.monotonic()) * 1000)
+                        if wait_ms <= 0:
+                            break
+                        # read_delay holds each wakeup open to batch events, so the ~30Hz camera
+                        # JPEG renames and 10Hz bridge writes cost at most two wakeups a second
+                        # and refreshes stay at least TELEMETRY_MIN_INTERVAL apart
+                        events = inotify.read(timeout=wait_ms, read_delay=read_delay)
+                        if any(event.name in TELEMETRY_FILES for event in events):
+                            break
+        except OSError as e:
+            print(f"[WARNING] inotify unavailable, polling telemetry files instead: {e}")
+
+    while True:
+        refresh_telemetry()
         time.sleep(0.5)
 
 def simulate_data():
     """Simulate telemetry data for testing"""
     import random
+    rng = np.random.default_rng() if np is not None else None
     while True:
-        # Simulate proximity data
-        for i in range(8):
-            if random.random() < 0.3:  # 30% chance of obstacle
-                telemetry_data['proximity'][i] = random.randint(50, 500)
+        # One lock hold per tick so readers only ever see a complete update
+        with telemetry_changed:
+            # Simulate proximity data - 30% chance of obstacle per sector
+            if rng is not None:
+                set_proximity(np.where(rng.random(8) < 0.3, rng.integers(50, 501, 8), 2500).tolist())
+                crop_roll, lidar_roll = rng.random(2)
             else:
-                telemetry_data['proximity'][i] = 2500
+                set_proximity([random.randint(50, 500) if random.random() < 0.3 else 2500 for _ in range(8)])
+                crop_roll, lidar_roll = random.random(), random.random()
 
-        # Update statistics
-        telemetry_data['statistics']['uptime'] += 1
-        telemetry_data['statistics']['messages_sent'] += random.randint(5, 15)
-        telemetry_data['statistics']['last_update'] = datetime.now().strftime('%H:%M:%S')
-        telemetry_data['statistics']['rplidar_success_rate'] = random.randint(94, 98)
-        telemetry_data['statistics']['realsense_fps'] = random.randint(28, 30)
+            # Update statistics
+            telemetry_data['statistics']['uptime'] += 1
+            telemetry_data['statistics']['messages_sent'] += random.randint(5, 15)
+            mark_updated()
+            telemetry_data['statistics']['rplidar_success_rate'] = random.randint(94, 98)
+            telemetry_data['statistics']['realsense_fps'] = random.randint(28, 30)
 
-        # Update status
-        telemetry_data['system_status'] = {
-            'proximity_bridge': 'RUNNING',
-            'data_relay': 'RUNNING',
-            'crop_monitor': 'RUNNING' if random.random() > 0.1 else 'STOPPED'
-        }
+            # Update status
+            telemetry_data['system_status'] = {
+                'proximity_bridge': 'RUNNING',
+                'data_relay': 'RUNNING',
+                'crop_monitor': 'RUNNING' if crop_roll > 0.1 else 'STOPPED'
+            }
 
-        telemetry_data['sensor_health'] = {
-            'rplidar': 'Good' if random.random() > 0.05 else 'Warning',
-            'realsense': 'Connected',
-            'pixhawk': 'Connected'
-        }
+            telemetry_data['sensor_health'] = {
+                'rplidar': 'Good' if lidar_roll > 0.05 else 'Warning',
+                'realsense': 'Connected',
+                'pixhawk': 'Connected'
+            }
 
+            publish_telemetry()
         time.sleep(0.5)
 
 if __name__ == '__main__':
@@ -1469,6 +2001,10 @@ if __name__ == '__main__':
     print("="*50 + "\n")
 
     try:
-        app.run(host='0.0.0.0', port=port, debug=False)
+        if GEVENT_AVAILABLE:
+            print("Serving with gevent")
+            WSGIServer(('0.0.0.0', port), app).serve_forever()
+        else:
+            app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
     except OSError as e:
         print(f"[ERROR] Failed to start server: {e}")